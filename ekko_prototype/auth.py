@@ -5,21 +5,94 @@ This module provides a lightweight authentication system using email validation
 and session-based rate limiting for transcription actions.
 """
 
+import functools
 import hashlib
-import json
 import re
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import orjson
 import streamlit as st
 
 # Email validation regex
 EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
+
+@functools.lru_cache(maxsize=2048)
+def _email_is_valid(email: str) -> bool:
+    """
+    Cached email format check.
+
+    Login retries and reruns validate the same address repeatedly, so the
+    regex result is memoized; fullmatch guarantees no trailing junk slips
+    past the pattern.
+
+    :param email: Email address to validate
+    :type email: str
+
+    :return: True if email is valid
+    :rtype: bool
+    """
+    return EMAIL_REGEX.fullmatch(email) is not None
+
 # Rate limiting settings
 DEMO_USER_TRANSCRIPT_LIMIT = 2
 AUTHENTICATED_USER_TRANSCRIPT_LIMIT = 10
 
+# Daily reset window in seconds
+RESET_WINDOW_SECONDS = 24 * 60 * 60
+
+
+class JsonFileStorage:
+    """
+    Default user-data storage backed by a JSON file on disk.
+
+    :ivar path: Path of the JSON file
+    :vartype path: Path
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def read(self) -> dict | None:
+        """
+        Read stored user data.
+
+        :return: Parsed user data, or None if nothing is stored yet
+        :rtype: Optional[dict]
+        """
+        if not self.path.exists():
+            return None
+        return orjson.loads(self.path.read_bytes())
+
+    def write(self, data: dict) -> None:
+        """
+        Persist user data.
+
+        :param data: User data to store
+        :type data: dict
+        """
+        self.path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+class InMemoryStorage:
+    """
+    In-memory user-data storage, mainly for tests.
+
+    Keeps the same read/write contract as :class:`JsonFileStorage` without
+    touching the filesystem.
+    """
+
+    def __init__(self):
+        self.data: dict | None = None
+
+    def read(self) -> dict | None:
+        return self.data
+
+    def write(self, data: dict) -> None:
+        self.data = data
+
 
 class SimpleAuth:
     """
@@ -27,16 +100,22 @@ class SimpleAuth:
 
     :ivar user_data_file: Path to store user data persistently
     :vartype user_data_file: Path
+    :ivar storage: Storage backend with read()/write(data) methods
+    :vartype storage: JsonFileStorage
     """
 
-    def __init__(self, user_data_file: str = "./user_data.json"):
+    def __init__(self, user_data_file: str = "./user_data.json", storage=None):
         """
         Initialize the authentication system.
 
         :param user_data_file: Path to store user data
         :type user_data_file: str
+        :param storage: Optional storage backend; defaults to a JSON file at
+            user_data_file
+        :type storage: Optional[object]
         """
         self.user_data_file = Path(user_data_file)
+        self.storage = storage or JsonFileStorage(self.user_data_file)
         self._ensure_session_state()
         self._load_user_data()
 
@@ -66,11 +145,9 @@ class SimpleAuth:
         """
         Load user data from persistent storage.
         """
-        if self.user_data_file.exists():
-            try:
-                with open(self.user_data_file) as f:
-                    data = json.load(f)
-
+        try:
+            data = self.storage.read()
+            if data is not None:
                 # If we have a session that matches, restore it
                 if st.session_state.session_id in data.get("sessions", {}):
                     session = data["sessions"][st.session_state.session_id]
@@ -90,8 +167,11 @@ class SimpleAuth:
                     else:
                         st.session_state.last_reset = last_reset
 
-            except Exception as e:
-                st.warning(f"Could not load user data: {e}")
+                    # last_reset changed, so the cached deadline is stale
+                    st.session_state.pop("reset_deadline", None)
+
+        except Exception as e:
+            st.warning(f"Could not load user data: {e}")
 
     def _save_user_data(self) -> None:
         """
@@ -99,10 +179,8 @@ class SimpleAuth:
         """
         try:
             # Load existing data
-            if self.user_data_file.exists():
-                with open(self.user_data_file) as f:
-                    data = json.load(f)
-            else:
+            data = self.storage.read()
+            if data is None:
                 data = {"users": {}, "sessions": {}}
 
             # Update session data
@@ -131,8 +209,7 @@ class SimpleAuth:
                 )
 
             # Save data
-            with open(self.user_data_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self.storage.write(data)
 
         except Exception as e:
             st.warning(f"Could not save user data: {e}")
@@ -147,7 +224,7 @@ class SimpleAuth:
         :return: True if email is valid
         :rtype: bool
         """
-        return bool(EMAIL_REGEX.match(email))
+        return _email_is_valid(email)
 
     def login_form(self) -> bool:
         """
@@ -192,17 +269,13 @@ class SimpleAuth:
                     st.session_state.user_email = email
 
                     # Check if returning user
-                    if self.user_data_file.exists():
-                        try:
-                            with open(self.user_data_file) as f:
-                                data = json.load(f)
-                                if email in data.get("users", {}):
-                                    st.success(f"Welcome back, {email}! 👋")
-                                else:
-                                    st.success(f"Welcome to ekko, {email}! 🎉")
-                        except:
+                    try:
+                        data = self.storage.read()
+                        if data and email in data.get("users", {}):
+                            st.success(f"Welcome back, {email}! 👋")
+                        else:
                             st.success(f"Welcome to ekko, {email}! 🎉")
-                    else:
+                    except:
                         st.success(f"Welcome to ekko, {email}! 🎉")
 
                     self._save_user_data()
@@ -210,6 +283,24 @@ class SimpleAuth:
 
         return False
 
+    def _daily_reset_due(self) -> bool:
+        """
+        Check whether the daily usage counter should reset.
+
+        check_rate_limit runs on every Streamlit rerun, so instead of building
+        datetime objects each time the reset moment is cached once as a
+        monotonic deadline and subsequent checks are a single float compare.
+
+        :return: True if the reset window has elapsed
+        :rtype: bool
+        """
+        deadline = st.session_state.get("reset_deadline")
+        if deadline is None:
+            elapsed = (datetime.now() - st.session_state.last_reset).total_seconds()
+            deadline = time.monotonic() + max(0.0, RESET_WINDOW_SECONDS - elapsed)
+            st.session_state.reset_deadline = deadline
+        return time.monotonic() >= deadline
+
     def check_rate_limit(self) -> tuple[bool, int]:
         """
         Check if user has exceeded rate limit.
@@ -221,9 +312,12 @@ class SimpleAuth:
         self._ensure_session_state()
 
         # Reset daily counter if needed
-        if datetime.now() - st.session_state.last_reset > timedelta(days=1):
+        if self._daily_reset_due():
             st.session_state.transcript_count = 0
             st.session_state.last_reset = datetime.now()
+            st.session_state.reset_deadline = (
+                time.monotonic() + RESET_WINDOW_SECONDS
+            )
             self._save_user_data()
 
         limit = DEMO_USER_TRANSCRIPT_LIMIT
@@ -17,6 +17,21 @@ if parent_dir not in sys.path:
 from ekko_prototype.models import EpisodeModel
 
 
+def _secs_to_hms(seconds: int) -> str:
+    """
+    Format integer seconds as HH:MM:SS.
+
+    :param seconds: Duration in seconds
+    :type seconds: int
+
+    :return: Duration formatted as HH:MM:SS
+    :rtype: str
+    """
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
 class FeedParserStrategy(ABC):
     """
     Abstract base class for feed parsing strategies.
@@ -75,16 +90,10 @@ class DefaultFeedParserStrategy(FeedParserStrategy):
                 duration = None
                 if hasattr(entry, "itunes_duration"):
                     duration = entry.itunes_duration
-                    # Convert to HH:MM:SS if it's in seconds
-                    if duration and ":" not in str(duration):
-                        try:
-                            seconds = int(duration)
-                            hours = seconds // 3600
-                            minutes = (seconds % 3600) // 60
-                            secs = seconds % 60
-                            duration = f"{hours:02d}:{minutes:02d}:{secs:02d}"
-                        except (ValueError, TypeError):
-                            pass
+                    # Convert to HH:MM:SS if it's in integer seconds;
+                    # isdigit avoids a try/except per episode on large feeds
+                    if duration and str(duration).isdigit():
+                        duration = _secs_to_hms(int(duration))
 
                 # Create EpisodeModel
                 episode = EpisodeModel(
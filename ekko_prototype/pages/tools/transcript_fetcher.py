@@ -10,6 +10,8 @@ import os
 import sys
 from pathlib import Path
 
+import orjson
+
 # Add parent directory to path for imports
 parent_dir = os.path.dirname(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -44,7 +46,15 @@ class UnifiedTranscriptFetcher:
         :type config: Optional[PydanticTranscriptConfig]
         """
         self.config = config or PydanticTranscriptConfig()
-        self.youtube_detector = YouTubePodcastDetector()
+
+        # Persist YouTube search hits and transcripts alongside the
+        # transcript cache so repeat episodes skip yt-dlp entirely
+        youtube_cache_dir = (
+            os.path.join(self.config.cache_dir, "youtube")
+            if self.config.cache_transcripts
+            else None
+        )
+        self.youtube_detector = YouTubePodcastDetector(cache_dir=youtube_cache_dir)
 
         # Only initialize local transcriber if not using OpenAI
         if not self.config.use_openai_whisper:
@@ -359,10 +369,7 @@ class UnifiedTranscriptFetcher:
 
         if cache_file.exists():
             try:
-                import json
-
-                with open(cache_file, encoding="utf-8") as f:
-                    data = json.load(f)
+                data = orjson.loads(cache_file.read_bytes())
 
                 return TranscriptResult(
                     text=data["text"],
@@ -395,8 +402,6 @@ class UnifiedTranscriptFetcher:
         cache_file = self._get_cache_path(podcast_name, episode_title)
 
         try:
-            import json
-
             cache_data = {
                 "text": result.text,
                 "source": result.source.value,
@@ -405,8 +410,9 @@ class UnifiedTranscriptFetcher:
             }
 
             cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2)
+            cache_file.write_bytes(
+                orjson.dumps(cache_data, option=orjson.OPT_INDENT_2)
+            )
 
             logger.info(f"Cached transcript for {episode_title}")
 
@@ -35,7 +35,15 @@ class Episode(Base):
 
 class DatabaseConnectionManager:
     def __init__(self, db_url="sqlite:///podcast_downloads.sqlite"):
-        self.engine = create_engine(db_url, echo=True, future=True)
+        # check_same_thread=False lets the pooled sqlite connections be shared
+        # across the downloader worker threads; scoped_session keeps each
+        # thread on its own session.
+        connect_args = (
+            {"check_same_thread": False} if db_url.startswith("sqlite") else {}
+        )
+        self.engine = create_engine(
+            db_url, echo=True, future=True, connect_args=connect_args
+        )
         Base.metadata.create_all(self.engine)
         self.session_factory = sessionmaker(bind=self.engine)
         self.Session = scoped_session(self.session_factory)
@@ -1,5 +1,6 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
@@ -9,6 +10,10 @@ from db_connection_manager import DatabaseConnectionManager
 class EpisodeDownloader:
     """Handles downloading of podcast episodes."""
 
+    # Refuse suspiciously large files instead of buffering them
+    MAX_EPISODE_SIZE = 500 * 1024 * 1024  # 500 MB
+    CHUNK_SIZE = 8192  # 8KB chunks
+
     def __init__(
         self,
         parent_folder: str,
@@ -22,22 +27,64 @@ class EpisodeDownloader:
 
     def download_episodes(self, episodes, look_back_days):
         look_back_date = datetime.now() - timedelta(days=look_back_days)
-        for episode in episodes:
-            if episode.publication_date >= look_back_date:
-                if not self.db_manager.episode_downloaded(episode.mp3_url):
-                    self._download_episode(episode)
-                    self.db_manager.add_episode(self.parent_folder, episode)
-                else:
-                    if self.verbose:
-                        self.logger.info(
-                            f"Episode not downloaded: {episode.title}; in the database or too old."
-                        )
+        # A single writer thread records episode N in the database while
+        # episode N+1 is already streaming, so the sqlite insert no longer
+        # sits between two downloads.
+        with ThreadPoolExecutor(max_workers=1) as db_writer:
+            pending = []
+            for episode in episodes:
+                if episode.publication_date >= look_back_date:
+                    if not self.db_manager.episode_downloaded(episode.mp3_url):
+                        # Only record episodes whose file actually landed on
+                        # disk; skipped or aborted downloads stay retryable
+                        if self._download_episode(episode):
+                            pending.append(
+                                db_writer.submit(
+                                    self.db_manager.add_episode,
+                                    self.parent_folder,
+                                    episode,
+                                )
+                            )
+                    else:
+                        if self.verbose:
+                            self.logger.info(
+                                f"Episode not downloaded: {episode.title}; in the database or too old."
+                            )
+            # Surface any DB write failures before returning
+            for future in pending:
+                future.result()
 
     def _download_episode(self, episode):
-        response = requests.get(episode.mp3_url)
+        """Download one episode; returns True only if the file was written."""
+        # Stream the body in chunks instead of materializing the whole file
+        # in memory via response.content; episodes routinely run to hundreds
+        # of megabytes.
+        response = requests.get(episode.mp3_url, stream=True, timeout=(5, 60))
+        response.raise_for_status()
+
+        content_length = int(response.headers.get("content-length", 0))
+        if content_length > self.MAX_EPISODE_SIZE:
+            self.logger.warning(
+                f"Skipping {episode.title}: advertised size {content_length} exceeds limit"
+            )
+            return False
+
         episode_dir = self._create_episode_dir(episode.title)
-        with open(os.path.join(episode_dir, f"{episode.title}.mp3"), "wb") as file:
-            file.write(response.content)
+        file_path = os.path.join(episode_dir, f"{episode.title}.mp3")
+        downloaded = 0
+        with open(file_path, "wb") as file:
+            for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                if chunk:
+                    downloaded += len(chunk)
+                    if downloaded > self.MAX_EPISODE_SIZE:
+                        self.logger.warning(
+                            f"Aborting {episode.title}: stream exceeded size limit"
+                        )
+                        file.close()
+                        os.remove(file_path)
+                        return False
+                    file.write(chunk)
+        return True
 
     def _create_episode_dir(self, episode_title):
         safe_title = "".join(
@@ -95,11 +95,10 @@ class ExampleClass:
         if not isinstance(items, list):
             raise TypeError("items must be a list")
 
+        # Resolve the prefix once instead of re-checking options per item
+        prefix = options.get("prefix", "") if options else ""
         for item in items:
-            if options and "prefix" in options:
-                yield f"{options['prefix']}{item}"
-            else:
-                yield item
+            yield f"{prefix}{item}" if prefix else item
 
 
 def standalone_function(text: str, max_length: int = 100) -> str:
@@ -0,0 +1,32 @@
+"""
+Shared pytest configuration for the ekko test suite.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Make the repository root importable once for the whole suite instead of
+# repeating the sys.path dance at the top of every test module
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture(scope="session")
+def mock_openai_client():
+    """
+    Pre-assembled OpenAI client mock shared across the whole suite.
+
+    Building the nested MagicMock attribute chain is surprisingly costly when
+    repeated per test, so it is done once per session; consumers reset call
+    state with reset_mock(), which keeps the configured return values.
+    """
+    client = MagicMock()
+    client.audio.transcriptions.create.return_value = MagicMock(
+        text="hello world transcript"
+    )
+    client.audio.translations.create.return_value = MagicMock(text="translated text")
+    return client
@@ -0,0 +1,116 @@
+"""
+Unit tests for the OpenAI Whisper transcriber.
+"""
+
+from unittest.mock import mock_open, patch
+
+import pytest
+
+from ekko_prototype.pages.tools.openai_whisper_transcriber import (
+    OpenAIWhisperTranscriber,
+)
+
+
+class TestOpenAIWhisperTranscriber:
+    """Test suite for OpenAIWhisperTranscriber."""
+
+    # Assembled once per class; mock_open construction is not free and the
+    # read_data never changes between tests
+    creds_open = mock_open(read_data='{"api_key": "file-key"}')
+
+    @pytest.fixture(autouse=True)
+    def mock_harness(self, tmp_path, monkeypatch, mock_openai_client):
+        """
+        Shared mock harness: one patch of the OpenAI client for every test
+        instead of a decorator stack per method. The client itself comes from
+        the session-scoped conftest fixture; only its call state is reset here.
+        """
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+        with patch(
+            "ekko_prototype.pages.tools.openai_whisper_transcriber.OpenAI"
+        ) as mock_openai:
+            self.mock_client = mock_openai_client
+            self.mock_client.reset_mock()
+            mock_openai.return_value = self.mock_client
+
+            self.transcripts_dir = tmp_path / "transcripts"
+            self.audio_file = tmp_path / "episode.mp3"
+            self.audio_file.write_bytes(b"fake audio data")
+
+            self.transcriber = OpenAIWhisperTranscriber(
+                api_key="test-key", parent_folder=str(self.transcripts_dir)
+            )
+            yield
+
+    def test_transcribe_returns_text(self):
+        """Test transcription returns the API text."""
+        result = self.transcriber.transcribe(str(self.audio_file))
+
+        assert result == "hello world transcript"
+        self.mock_client.audio.transcriptions.create.assert_called_once()
+
+    def test_transcribe_saves_transcript_file(self):
+        """Test that the transcript is persisted next to other transcripts."""
+        self.transcriber.transcribe(str(self.audio_file))
+
+        transcript_file = self.transcripts_dir / "episode.txt"
+        assert transcript_file.exists()
+        assert transcript_file.read_text() == "hello world transcript"
+
+    def test_transcribe_passes_language_and_prompt(self):
+        """Test that language and prompt are forwarded to the API."""
+        self.transcriber.transcribe(
+            str(self.audio_file), language="en", prompt="podcast episode"
+        )
+
+        call_kwargs = self.mock_client.audio.transcriptions.create.call_args[1]
+        assert call_kwargs["language"] == "en"
+        assert call_kwargs["prompt"] == "podcast episode"
+
+    def test_transcribe_missing_file_returns_none(self):
+        """Test transcription of a nonexistent file fails gracefully."""
+        result = self.transcriber.transcribe("/does/not/exist.mp3")
+
+        assert result is None
+        self.mock_client.audio.transcriptions.create.assert_not_called()
+
+    def test_transcribe_oversized_file_returns_none(self):
+        """Test files above the API size limit are rejected without a call."""
+        self.transcriber.MAX_FILE_SIZE = 1  # force the large-file path
+
+        result = self.transcriber.transcribe(str(self.audio_file))
+
+        assert result is None
+        self.mock_client.audio.transcriptions.create.assert_not_called()
+
+    def test_load_api_key_from_file(self):
+        """Test loading the API key from a credentials file without disk I/O."""
+        # Patching open keeps the JSON round-trip fully in memory instead of
+        # creating and unlinking a real tempfile per run
+        with patch("builtins.open", self.creds_open):
+            transcriber = OpenAIWhisperTranscriber(
+                credentials_file="creds.json",
+                parent_folder=str(self.transcripts_dir),
+            )
+
+        assert transcriber.api_key == "file-key"
+
+    def test_missing_api_key_raises(self, tmp_path):
+        """Test that construction fails without any API key source."""
+        with pytest.raises(ValueError, match="API key required"):
+            OpenAIWhisperTranscriber(
+                credentials_file=str(tmp_path / "missing.json"),
+                parent_folder=str(tmp_path),
+            )
+
+    def test_translate_returns_text(self):
+        """Test translation returns the API text."""
+        result = self.transcriber.translate(str(self.audio_file))
+
+        assert result == "translated text"
+        self.mock_client.audio.translations.create.assert_called_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,16 +2,10 @@
 Unit tests for the retry decorator.
 """
 
-import os
-import sys
-import time
 from unittest.mock import patch
 
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from ekko_prototype.pages.tools.retry import retry
 
 
@@ -79,20 +73,20 @@ class TestRetryDecorator:
         assert result == 6
         assert call_count == 2
 
-    def test_retry_sleep_between_attempts(self):
+    @patch("ekko_prototype.pages.tools.retry.time.sleep")
+    def test_retry_sleep_between_attempts(self, mock_sleep):
         """Test that retry sleeps between attempts."""
 
         @retry(num_retries=2, sleep_between=0.1)
         def always_fails():
             raise ValueError("Fail")
 
-        start_time = time.time()
         with pytest.raises(ValueError):
             always_fails()
-        elapsed = time.time() - start_time
 
-        # Should have slept at least once (0.1 seconds)
-        assert elapsed >= 0.1
+        # Should have slept exactly once, for the configured interval,
+        # without actually blocking the test run
+        mock_sleep.assert_called_once_with(0.1)
 
     def test_retry_preserves_function_metadata(self):
         """Test that retry decorator preserves function metadata."""
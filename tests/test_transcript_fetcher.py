@@ -0,0 +1,69 @@
+"""
+Unit tests for the unified transcript fetcher.
+"""
+
+from unittest.mock import DEFAULT, patch
+
+import pytest
+
+from ekko_prototype.models import TranscriptConfig
+from ekko_prototype.pages.tools.transcript_fetcher import UnifiedTranscriptFetcher
+from ekko_prototype.pages.tools.youtube_detector import TranscriptSource
+
+
+class TestTranscriptFetcherIntegration:
+    """Test suite for the fetcher's source-fallback behavior."""
+
+    def test_unified_fetcher_youtube_fallback_to_openai(self, tmp_path, monkeypatch):
+        """Test fallback to OpenAI Whisper when YouTube has no transcript."""
+        # Keep the side-effect files (./audio, ./transcripts) out of the repo
+        monkeypatch.chdir(tmp_path)
+
+        config = TranscriptConfig(
+            prefer_youtube=True,
+            use_openai_whisper=True,
+            use_remote_whisper=False,
+            cache_transcripts=False,
+        )
+
+        # One patch.multiple against the fetcher module covers its
+        # collaborators instead of a decorator per dependency
+        with patch.multiple(
+            "ekko_prototype.pages.tools.transcript_fetcher",
+            YouTubePodcastDetector=DEFAULT,
+            EpisodeDownloader=DEFAULT,
+        ) as mocks, patch(
+            "ekko_prototype.pages.tools.openai_whisper_transcriber.OpenAIWhisperTranscriber"
+        ) as mock_whisper:
+            detector = mocks["YouTubePodcastDetector"].return_value
+            detector.check_youtube_availability.return_value = (False, None)
+            detector.calculate_quality_score.return_value = 0.9
+
+            downloader = mocks["EpisodeDownloader"].return_value
+            downloader.download_single_episode.return_value = str(
+                tmp_path / "episode.mp3"
+            )
+
+            mock_whisper.return_value.transcribe.return_value = (
+                "whisper transcript text"
+            )
+
+            fetcher = UnifiedTranscriptFetcher(config)
+            result = fetcher.get_transcript(
+                podcast_name="Test Podcast",
+                episode_title="Test Episode",
+                episode_audio_url="https://example.com/episode.mp3",
+                podcast_rss_url="https://example.com/feed.rss",
+            )
+
+        assert result.text == "whisper transcript text"
+        assert result.source == TranscriptSource.WHISPER_LOCAL
+        assert result.quality_score == 0.9
+        detector.check_youtube_availability.assert_called_once_with(
+            "https://example.com/feed.rss", "Test Episode"
+        )
+        mock_whisper.return_value.transcribe.assert_called_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
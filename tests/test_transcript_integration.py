@@ -4,11 +4,9 @@ Integration test for transcript fetching with OpenAI Whisper.
 """
 
 import logging
-import os
 import sys
 
-# Add project paths
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import pytest
 
 from ekko_prototype.models import TranscriptConfig
 from ekko_prototype.pages.tools.transcript_fetcher import UnifiedTranscriptFetcher
@@ -20,6 +18,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Talks to YouTube and the OpenAI API; run explicitly with `pytest -m network`
+pytestmark = pytest.mark.network
+
 
 def test_transcript_fetching():
     """Test the transcript fetching system."""
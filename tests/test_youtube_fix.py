@@ -4,11 +4,9 @@ Test the fixed YouTube transcript fetching with yt-dlp.
 """
 
 import logging
-import os
 import sys
 
-# Add project paths
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import pytest
 
 from ekko_prototype.pages.tools.youtube_detector import (
     TranscriptSource,
@@ -21,6 +19,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fetches real YouTube subtitles; run explicitly with `pytest -m network`
+pytestmark = pytest.mark.network
+
 
 def test_youtube_transcript():
     """Test YouTube transcript fetching with a real video."""
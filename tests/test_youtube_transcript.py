@@ -2,59 +2,64 @@
 Unit tests for YouTube transcript detection and fetching.
 """
 
-import os
-import sys
-import unittest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock
 
-# Add the parent directory to the path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
+from ekko_prototype.pages.tools import youtube_detector
 from ekko_prototype.pages.tools.youtube_detector import (
     YouTubePodcastDetector,
 )
 
 
-class TestYouTubeDetector(unittest.TestCase):
+class TestYouTubeDetector:
     """Test YouTube transcript detection and fetching."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @pytest.fixture(autouse=True)
+    def detector(self):
+        """Detector under test, rebuilt per test."""
         self.detector = YouTubePodcastDetector()
 
+    @pytest.fixture
+    def mock_ydl(self, monkeypatch):
+        """
+        Monkeypatch yt_dlp.YoutubeDL and return the context-managed
+        instance; a single setattr revert on teardown is cheaper than the
+        introspection unittest.mock.patch does per test.
+        """
+        monkeypatch.delenv("YOUTUBE_API_KEY", raising=False)
+        mock_ydl_class = MagicMock()
+        monkeypatch.setattr("yt_dlp.YoutubeDL", mock_ydl_class)
+        return mock_ydl_class.return_value.__enter__.return_value
+
     def test_extract_video_id_standard_url(self):
         """Test extracting video ID from standard YouTube URL."""
         url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         video_id = self.detector.extract_video_id(url)
-        self.assertEqual(video_id, "dQw4w9WgXcQ")
+        assert video_id == "dQw4w9WgXcQ"
 
     def test_extract_video_id_short_url(self):
         """Test extracting video ID from shortened YouTube URL."""
         url = "https://youtu.be/dQw4w9WgXcQ"
         video_id = self.detector.extract_video_id(url)
-        self.assertEqual(video_id, "dQw4w9WgXcQ")
+        assert video_id == "dQw4w9WgXcQ"
 
     def test_extract_video_id_embed_url(self):
         """Test extracting video ID from embedded YouTube URL."""
         url = "https://www.youtube.com/embed/dQw4w9WgXcQ"
         video_id = self.detector.extract_video_id(url)
-        self.assertEqual(video_id, "dQw4w9WgXcQ")
+        assert video_id == "dQw4w9WgXcQ"
 
     def test_extract_video_id_invalid_url(self):
         """Test extracting video ID from invalid URL returns None."""
         url = "https://example.com/not-a-youtube-url"
         video_id = self.detector.extract_video_id(url)
-        self.assertIsNone(video_id)
+        assert video_id is None
 
-    @patch("yt_dlp.YoutubeDL")
-    def test_search_youtube_for_episode_success(self, mock_ydl_class):
+    def test_search_youtube_for_episode_success(self, mock_ydl):
         """Test successful YouTube search for podcast episode."""
-        # Mock the YoutubeDL instance
-        mock_ydl = MagicMock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
-
         # Mock search results - use valid 11-character video ID
-        mock_results = {
+        mock_ydl.extract_info.return_value = {
             "entries": [
                 {
                     "id": "dQw4w9WgXcQ",  # Valid 11-character YouTube ID
@@ -62,7 +67,6 @@ class TestYouTubeDetector(unittest.TestCase):
                 }
             ]
         }
-        mock_ydl.extract_info.return_value = mock_results
 
         # Test the search
         result = self.detector.search_youtube_for_episode(
@@ -71,19 +75,13 @@ class TestYouTubeDetector(unittest.TestCase):
         )
 
         # Verify the result
-        self.assertEqual(result, "https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        assert result == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         mock_ydl.extract_info.assert_called_once()
 
-    @patch("yt_dlp.YoutubeDL")
-    def test_search_youtube_for_episode_no_results(self, mock_ydl_class):
+    def test_search_youtube_for_episode_no_results(self, mock_ydl):
         """Test YouTube search with no results."""
-        # Mock the YoutubeDL instance
-        mock_ydl = MagicMock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
-
         # Mock empty search results
-        mock_results = {"entries": []}
-        mock_ydl.extract_info.return_value = mock_results
+        mock_ydl.extract_info.return_value = {"entries": []}
 
         # Test the search
         result = self.detector.search_youtube_for_episode(
@@ -91,44 +89,44 @@ class TestYouTubeDetector(unittest.TestCase):
         )
 
         # Verify no result
-        self.assertIsNone(result)
+        assert result is None
 
+    @pytest.mark.skip(
+        reason="YouTube API mocking is complex and not critical for current functionality"
+    )
     def test_fetch_youtube_transcript_success_skipped(self):
         """Skip this test - YouTube API mocking is complex and not critical."""
-        self.skipTest(
-            "YouTube API mocking is complex and not critical for current functionality"
-        )
 
+    @pytest.mark.skip(
+        reason="YouTube API mocking is complex and not critical for current functionality"
+    )
     def test_fetch_youtube_transcript_auto_generated_skipped(self):
         """Skip this test - YouTube API mocking is complex and not critical."""
-        self.skipTest(
-            "YouTube API mocking is complex and not critical for current functionality"
-        )
 
+    @pytest.mark.skip(
+        reason="YouTube API mocking is complex and not critical for current functionality"
+    )
     def test_fetch_youtube_transcript_not_available_skipped(self):
         """Skip this test - YouTube API mocking is complex and not critical."""
-        self.skipTest(
-            "YouTube API mocking is complex and not critical for current functionality"
-        )
 
-    @patch("ekko_prototype.pages.tools.youtube_detector.feedparser")
-    def test_check_youtube_availability(self, mock_feedparser):
+    def test_check_youtube_availability(self, monkeypatch):
         """Test checking if episode is available on YouTube."""
-        # Mock RSS feed
-        mock_feed = Mock()
-        mock_feed.feed = {"title": "Lenny's Podcast"}
-        mock_feedparser.parse.return_value = mock_feed
-
-        # Mock successful YouTube search - use valid 11-character video ID
-        with patch.object(self.detector, "search_youtube_for_episode") as mock_search:
-            mock_search.return_value = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        # Mock the streamed channel-title lookup and the search itself
+        monkeypatch.setattr(
+            youtube_detector, "_read_feed_title", lambda *args: "Lenny's Podcast"
+        )
+        monkeypatch.setattr(
+            self.detector,
+            "search_youtube_for_episode",
+            lambda *args: "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        )
 
-            is_available, url = self.detector.check_youtube_availability(
-                "https://example.com/feed.rss", "Test Episode"
-            )
+        is_available, url = self.detector.check_youtube_availability(
+            "https://example.com/feed.rss", "Test Episode"
+        )
 
-            self.assertTrue(is_available)
-            self.assertEqual(url, "https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        assert is_available
+        assert url == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
 
     def test_calculate_quality_score(self):
         """Test transcript quality score calculation."""
@@ -137,22 +135,22 @@ class TestYouTubeDetector(unittest.TestCase):
             "This is a high quality transcript with proper sentences. " * 100
         )
         score = self.detector.calculate_quality_score(good_transcript)
-        self.assertGreater(score, 0.8)
+        assert score > 0.8
 
         # Test with poor quality transcript
         poor_transcript = "short text"
         score = self.detector.calculate_quality_score(poor_transcript)
-        self.assertLess(score, 0.7)
+        assert score < 0.7
 
         # Test with transcript containing errors
         error_transcript = "[inaudible] some text [music] ... " * 50
         score = self.detector.calculate_quality_score(error_transcript)
-        self.assertLess(score, 0.8)
+        assert score < 0.8
 
         # Test with None transcript
         score = self.detector.calculate_quality_score(None)
-        self.assertEqual(score, 0.0)
+        assert score == 0.0
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__, "-v"])